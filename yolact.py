@@ -476,7 +476,13 @@ class Yolact(nn.Module):
     
     def load_weights(self, path):
         """ Loads weights from a compressed save file. """
-        state_dict = torch.load(path)
+        # Memory map the checkpoint so load_state_dict copies straight from the file instead of
+        # from a second full in-memory copy. Older pytorch versions and legacy (non-zipfile)
+        # checkpoints don't support this, so fall back to a regular load for those.
+        try:
+            state_dict = torch.load(path, map_location='cpu', mmap=True)
+        except (TypeError, RuntimeError):
+            state_dict = torch.load(path)
 
         # For backward compatability, remove these (the new variable is called layers)
         for key in list(state_dict.keys()):